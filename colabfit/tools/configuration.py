@@ -1,5 +1,6 @@
 import datetime
 from string import ascii_lowercase, ascii_uppercase
+from zlib import crc32
 #from types import NoneType
 
 import dateutil
@@ -7,7 +8,7 @@ import numpy as np
 from ase import Atoms
 
 from colabfit import ATOMS_LABELS_FIELD, ATOMS_NAME_FIELD
-from colabfit.tools.schema import config_schema
+from colabfit.tools.schema import N_BUCKETS, config_schema
 from colabfit.tools.utilities import (
     _empty_dict_from_schema,
     _hash,
@@ -87,6 +88,7 @@ class AtomicConfiguration(Atoms):
 
         self.spark_row["id"] = self.id
         self.spark_row["hash"] = str(self._hash)
+        self.spark_row["bucket_id"] = crc32(self.id.encode("utf-8")) % N_BUCKETS
         # self.spark_row["dataset_ids"] = [self.dataset_id]
         self.spark_row = self.spark_row
         # Check for name conflicts in info/arrays; would cause bug in parsing
@@ -236,7 +238,8 @@ class AtomicConfiguration(Atoms):
         co_dict["positions"] = self.positions.astype(float).tolist()
         co_dict["names"] = self.names
         co_dict["labels"] = self.labels
-        co_dict["pbc"] = self.pbc.astype(bool).tolist()
+        pbc = self.pbc.astype(bool)
+        co_dict["pbc"] = int(pbc[0]) | (int(pbc[1]) << 1) | (int(pbc[2]) << 2)
         co_dict["last_modified"] = dateutil.parser.parse(
             datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         )
@@ -1,12 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from hashlib import sha512
+from hashlib import blake2b
 
-import dateutil.parser
-#from pyspark.sql import functions as sf
-#from pyspark.sql.types import StringType
+import numpy as np
+from pyspark.sql import functions as sf
 
-#from colabfit.tools.schema import configuration_set_schema
-from colabfit.tools.utilities import ELEMENT_MAP, _empty_dict_from_schema
+from colabfit.tools.schema import configuration_set_schema
+from colabfit.tools.utilities import ELEMENT_ARR, _empty_dict_from_schema
+
+# The schema never changes at runtime, so build the empty row once at import
+_EMPTY_ROW_TEMPLATE = _empty_dict_from_schema(configuration_set_schema)
 
 
 class ConfigurationSet:
@@ -46,90 +49,133 @@ class ConfigurationSet:
 
     """
 
-    def __init__(self, config_df, name, description, dataset_id, ordered=False):
+    __slots__ = (
+        "name",
+        "description",
+        "dataset_id",
+        "spark_row",
+        "id",
+        "_hash",
+        "_hash_cache",
+        "_repr",
+    )
+
+    def __init__(
+        self, config_df, name, description, dataset_id, ordered=False, agg_row=None
+    ):
         self.name = name
         self.description = description
         self.dataset_id = dataset_id
         # self.ordered = ordered
-        self.spark_row = self.to_spark_row(config_df)
+        if agg_row is not None:
+            self.spark_row = self._row_dict_from_agg(agg_row)
+        else:
+            self.spark_row = self.to_spark_row(config_df)
         self.id = f"CS_{self.name}_{self.dataset_id}"
         self._hash = hash(self)
         self.spark_row["id"] = self.id
         self.spark_row["extended_id"] = f"{self.name}__{self.id}"
         self.spark_row["hash"] = str(self._hash)
+        self._repr = (
+            f"ConfigurationSet(description='{self.description}', "
+            f"nconfigurations={self.spark_row['nconfigurations']})"
+        )
+
+    @staticmethod
+    def _aggregates():
+        """Aggregate expressions consumed by :meth:`_row_dict_from_agg`"""
+        return [
+            sf.countDistinct("id").alias("nconfigurations"),
+            sf.sum("nsites").alias("nsites"),
+            sf.collect_set("nperiodic_dimensions").alias("nperiodic_dimensions"),
+            sf.collect_set("dimension_types").alias("dimension_types"),
+            sf.sort_array(
+                sf.array_distinct(sf.flatten(sf.collect_list("elements")))
+            ).alias("elements"),
+            sf.flatten(sf.collect_list("atomic_numbers")).alias("atomic_numbers"),
+        ]
+
+    @classmethod
+    def build_many(cls, parent_df, set_key_col, names, descriptions, dataset_id):
+        """
+        Build one ConfigurationSet per distinct value of ``set_key_col`` in
+        ``parent_df`` using a single grouped aggregation, instead of one Spark
+        job per set.
+
+        ``names`` and ``descriptions`` are dicts keyed by the values of
+        ``set_key_col``.
+        """
+        agg_rows = (
+            parent_df.groupBy(set_key_col).agg(*cls._aggregates()).collect()
+        )
+        return [
+            cls(
+                None,
+                names[agg_row[set_key_col]],
+                descriptions[agg_row[set_key_col]],
+                dataset_id,
+                agg_row=agg_row,
+            )
+            for agg_row in agg_rows
+        ]
 
     def to_spark_row(self, config_df):
-        row_dict = _empty_dict_from_schema(configuration_set_schema)
+        agg_row = config_df.agg(*self._aggregates()).first()
+        return self._row_dict_from_agg(agg_row)
+
+    def _row_dict_from_agg(self, agg_row):
+        row_dict = _EMPTY_ROW_TEMPLATE.copy()
         row_dict["name"] = self.name
         row_dict["description"] = self.description
-        row_dict["nconfigurations"] = config_df.select("id").distinct().count()
-        row_dict["last_modified"] = dateutil.parser.parse(
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        )
-        # config_df = config_df.withColumn(
-        #     "nsites_multiple", sf.col("nsites") * sf.col("multiplicity")
-        # )
-        row_dict["nsites"] = config_df.agg({"nsites": "sum"}).first()[0]
-        row_dict["elements"] = sorted(
-            config_df.withColumn("exploded_elements", sf.explode("elements"))
-            .agg(sf.collect_set("exploded_elements").alias("exploded_elements"))
-            .select("exploded_elements")
-            .take(1)[0][0]
-        )
-        row_dict["nperiodic_dimensions"] = config_df.agg(
-            sf.collect_set("nperiodic_dimensions")
-        ).collect()[0][0]
-        row_dict["dimension_types"] = config_df.agg(
-            sf.collect_set("dimension_types")
-        ).collect()[0][0]
-        atomic_ratios_df = (
-            config_df.select("atomic_numbers")
-            #     config_df.select("atomic_numbers", "multiplicity")
-            #     .withColumn(
-            #         "repeated_numbers",
-            #         sf.expr(
-            #            "transform(atomic_numbers, x -> array_repeat(x, multiplicity))"
-            #         ),
-            #     )
-            # .withColumn("single_element", sf.explode(sf.flatten("repeated_numbers")))
-            .withColumn("single_element", sf.explode("atomic_numbers"))
+        row_dict["last_modified"] = datetime.now().replace(microsecond=0)
+        row_dict["nconfigurations"] = agg_row["nconfigurations"]
+        row_dict["nsites"] = agg_row["nsites"]
+        row_dict["nperiodic_dimensions"] = agg_row["nperiodic_dimensions"]
+        row_dict["dimension_types"] = agg_row["dimension_types"]
+        row_dict["elements"] = agg_row["elements"]
+        row_dict["nelements"] = len(row_dict["elements"])
+        counts = np.bincount(
+            np.asarray(agg_row["atomic_numbers"], dtype=np.int64), minlength=119
         )
-        total_elements = atomic_ratios_df.count()
-        print(total_elements, row_dict["nsites"])
+        total_elements = int(counts.sum())
         assert total_elements == row_dict["nsites"]
-        atomic_ratios_df = atomic_ratios_df.groupBy("single_element").count()
-        atomic_ratios_df = atomic_ratios_df.withColumn(
-            "ratio", sf.col("count") / total_elements
-        )
-        atomic_ratios_coll = (
-            atomic_ratios_df.withColumn(
-                "element",
-                sf.udf(lambda x: ELEMENT_MAP[int(x)], StringType())(
-                    sf.col("single_element")
-                ),
-            )
-            .select("element", "ratio")
-            .collect()
-        )
-        row_dict["total_elements_ratios"] = [
-            x[1] for x in sorted(atomic_ratios_coll, key=lambda x: x["element"])
-        ]
-        row_dict["nelements"] = len(row_dict["elements"])
-        row_dict["nsites"] = config_df.agg({"nsites": "sum"}).first()[0]
+        occupied = counts.nonzero()[0]
+        ratios = counts[occupied] / total_elements
+        # Ratios are ordered by element symbol, matching row_dict["elements"]
+        order = np.argsort([ELEMENT_ARR[z] for z in occupied])
+        row_dict["total_elements_ratios"] = ratios[order].tolist()
         row_dict["dataset_id"] = self.dataset_id
 
         return row_dict
 
     def __hash__(self):
-        cs_hash = sha512()
-        cs_hash.update(self.id.encode("utf-8"))
-        return int(cs_hash.hexdigest(), 16)
+        if getattr(self, "_hash_cache", None) is None:
+            self._hash_cache = int.from_bytes(
+                blake2b(self.id.encode("utf-8"), digest_size=16).digest(), "big"
+            )
+        return self._hash_cache
 
     def __str__(self):
-        return "ConfigurationSet(description='{}', nconfigurations={})".format(
-            self.description,
-            self.spark_row["nconfigurations"],
-        )
+        return self._repr
 
     def __repr__(self):
-        return str(self)
+        return self._repr
+
+
+def build_configuration_sets(specs, max_workers=8):
+    """
+    Build ConfigurationSets concurrently on a thread pool.
+
+    Spark actions release the GIL while waiting on the JVM, so submitting the
+    constructors to worker threads overlaps their aggregation jobs against the
+    shared Spark session. ``specs`` is an iterable of
+    ``(config_df, name, description, dataset_id)`` tuples.
+
+    Prefer :meth:`ConfigurationSet.build_many` when every set is a slice of
+    one parent DataFrame keyed by a column; that path fuses the whole batch
+    into a single Spark job. This helper is for sets built from unrelated
+    DataFrames, where the jobs can only be overlapped, not fused.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(ConfigurationSet, *spec) for spec in specs]
+        return [future.result() for future in futures]
@@ -18,7 +18,7 @@ import boto3
 import dateutil.parser
 import psycopg
 from psycopg.rows import dict_row
-#import pyarrow as pa
+import pyarrow as pa
 #import pyspark.sql.functions as sf
 from botocore.exceptions import ClientError
 from django.utils.crypto import get_random_string
@@ -643,7 +643,6 @@ class VastDataLoader:
         """
         po_df = self.read_table(self.prop_object_table, unstring=True)
         po_df = self.get_filtered_table(po_df, po_filter_conditions)
-        po_df = po_df.drop("chemical_formula_hill")
 
         co_df = self.read_table(self.config_table, unstring=True)
         overlap_cols = [col for col in po_df.columns if col in co_df.columns]
@@ -848,7 +847,6 @@ class VastDataLoader:
             "atomization_energy",
             "cauchy_stress",
             "cauchy_stress_volume_normalized",
-            "chemical_formula_hill",
             "configuration_id",
             "dataset_id",
             "electronic_band_gap",
@@ -860,17 +858,8 @@ class VastDataLoader:
             "software",
         ]
         spark_dict = spark_row.asDict()
-        if spark_dict["atomic_forces_01"] is None:
-            spark_dict["atomic_forces"] = literal_eval(spark_dict["atomic_forces_00"])
-        else:
-            spark_dict["atomic_forces"] = list(
-                itertools.chain(
-                    *[
-                        literal_eval(spark_dict[f"atomic_forces_{i:02}"])
-                        for i in range(1, 19)
-                    ]
-                )
-            )
+        if spark_dict["atomic_forces"] is not None:
+            spark_dict["atomic_forces"] = literal_eval(spark_dict["atomic_forces"])
         if spark_dict["cauchy_stress"] is not None:
             spark_dict["cauchy_stress"] = literal_eval(spark_dict["cauchy_stress"])
         spark_dict["last_modified"] = dateutil.parser.parse(
@@ -879,13 +868,15 @@ class VastDataLoader:
             )
         )
         spark_dict["hash"] = _hash(spark_dict, hash_keys, include_keys_in_hash=False)
+        if spark_dict["atomic_forces"] is not None:
+            spark_dict["atomic_forces"] = str(spark_dict["atomic_forces"])
         if spark_dict["cauchy_stress"] is not None:
             spark_dict["cauchy_stress"] = str(spark_dict["cauchy_stress"])
         id = f'PO_{spark_dict["hash"]}'
         if len(id) > 28:
             id = id[:28]
         spark_dict["id"] = id
-        return Row(**{k: v for k, v in spark_dict.items() if k != "atomic_forces"})
+        return Row(**spark_dict)
 
     @udf(returnType=StringType())
     def config_structure_hash(spark_row: Row, hash_keys: list[str]):
@@ -1250,7 +1241,6 @@ class DataManager:
                             po_df,
                             loader.prop_object_table,
                             ids_filter=new_po_ids,
-                            check_length_col="atomic_forces_00",
                             check_unique=False,
                         )
                     # print(
@@ -1264,7 +1254,6 @@ class DataManager:
                     loader.write_table(
                         po_df,
                         loader.prop_object_table,
-                        check_length_col="atomic_forces_00",
                         check_unique=False,
                     )
                     print(
@@ -1347,7 +1336,7 @@ class DataManager:
                 t.append(co_row['dataset_ids'][0])
                 # t.append(co_row['dataset_ids'][0])
                 co_values.append(t)
-            sql_co = "INSERT INTO configurations (id, hash, last_modified, dataset_ids, configuration_set_ids, chemical_formula_hill, chemical_formula_reduced, chemical_formula_anonymous, elements, elements_ratios, atomic_numbers, nsites, nelements, nperiodic_dimensions, cell, dimension_types, pbc, names, labels, positions) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT (hash) DO UPDATE SET dataset_ids = array_append(configurations.dataset_ids, %s);"
+            sql_co = "INSERT INTO configurations (id, hash, last_modified, dataset_ids, configuration_set_ids, chemical_formula_hill, chemical_formula_reduced, chemical_formula_anonymous, elements, elements_ratios, atomic_numbers, nsites, nelements, nperiodic_dimensions, cell, dimension_types, pbc, names, labels, positions, bucket_id) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT (hash) DO UPDATE SET dataset_ids = array_append(configurations.dataset_ids, %s);"
 # TODO: Need to modify dataset.from_pg to properly aggregate values and get data to get two copie
 
 #SET dataset_ids = CASE WHEN NOT (%s = ANY(configurations.dataset_ids)) THEN array_append(configurations.dataset_ids, %s) ELSE configurations.dataset_ids END;"
@@ -1458,7 +1447,8 @@ class DataManager:
         configuration_id VARCHAR (256),
         dataset_id VARCHAR (256),
         multiplicity INT,
-        metadata VARCHAR (10000)
+        metadata VARCHAR (10000),
+        bucket_id INT
         )
         """
         # Don't need anymore
@@ -1513,10 +1503,11 @@ class DataManager:
         nperiodic_dimensions INT,
         cell DOUBLE PRECISION [] [],
         dimension_types INT [],
-        pbc BOOL[],
+        pbc SMALLINT,
         names VARCHAR (256) [],
         labels VARCHAR (256) [],
-        positions DOUBLE PRECISION [][]
+        positions DOUBLE PRECISION [][],
+        bucket_id INT
         )
         """
         with psycopg.connect(dbname=self.dbname, user=self.user, port=self.port, host=self.host, password=self.password) as conn:
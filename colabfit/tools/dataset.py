@@ -326,7 +326,7 @@ class Dataset:
 
         for prop in [
             "atomization_energy",
-            "atomic_forces_00",
+            "atomic_forces",
             "adsorption_energy",
             "electronic_band_gap",
             "cauchy_stress",
@@ -336,7 +336,6 @@ class Dataset:
             row_dict[f"{prop}_count"] = (
                 prop_df.select(prop).where(f"{prop} is not null").count()
             )
-        row_dict["atomic_forces_count"] = row_dict.pop("atomic_forces_00_count")
 
         prop = "energy"
         row_dict[f"{prop}_variance"] = (
@@ -1,15 +1,17 @@
 import datetime
-import itertools
+import functools
+import hashlib
 import json
 import os
+import re
 import tempfile
 import warnings
 from collections import namedtuple
-from copy import deepcopy
+from zlib import crc32
 
-import dateutil.parser
 import kim_edn
 import numpy as np
+import orjson
 from ase.units import create_units
 from kim_property import (
     check_instance_optional_key_marked_required_are_present,
@@ -18,10 +20,9 @@ from kim_property import (
 from kim_property.definition import PROPERTY_ID as VALID_KIM_ID
 
 from colabfit.tools.configuration import AtomicConfiguration
-from colabfit.tools.schema import property_object_schema
+from colabfit.tools.schema import N_BUCKETS, property_object_schema
 from colabfit.tools.utilities import (
     _empty_dict_from_schema,
-    _hash,
     _parse_unstructured_metadata,
 )
 
@@ -43,6 +44,9 @@ UNITS["rydberg"] = UNITS["Rydberg"]
 UNITS["debye"] = UNITS["Debye"]
 UNITS["kbar"] = UNITS["bar"] * 1000
 
+# Plain dict of floats so the conversion path skips ASE's wrapper dispatch
+_UNIT_FACTORS = {k: float(v) for k, v in UNITS.items()}
+
 prop_info = namedtuple("prop_info", ["key", "unit", "dtype"])
 energy_info = prop_info("energy", "eV", float)
 force_info = prop_info("forces", "eV/angstrom", list)
@@ -58,24 +62,41 @@ MAIN_KEY_MAP = {
 
 # These are fields that are related to the geometry of the atomic structure
 # or the OpenKIM Property Definition and shouldn't be used for equality checks
-_ignored_fields = [
-    "property-title",
-    "property-description",
-    "instance-id",
-    "species",
-    "unrelaxed-configuration-positions",
-    "unrelaxed-periodic-cell-vector-1",
-    "unrelaxed-periodic-cell-vector-2",
-    "unrelaxed-periodic-cell-vector-3",
-]
-_hash_ignored_fields = [
-    "id",
-    "hash",
-    "last_modified",
-    "multiplicity",
-    "metadata_path",
-    "metadata_size",
-]
+_ignored_fields = frozenset(
+    {
+        "property-title",
+        "property-description",
+        "instance-id",
+        "species",
+        "unrelaxed-configuration-positions",
+        "unrelaxed-periodic-cell-vector-1",
+        "unrelaxed-periodic-cell-vector-2",
+        "unrelaxed-periodic-cell-vector-3",
+    }
+)
+_hash_ignored_fields = frozenset(
+    {
+        "id",
+        "hash",
+        "last_modified",
+        "multiplicity",
+        "metadata_path",
+        "metadata_size",
+    }
+)
+
+_MD_KEYS = frozenset({"metadata", "_metadata"})
+
+# Sorted identifier-key tuples memoized per observed row key set. The flat
+# row keys are instance-derived (e.g. energy_energy) and do not match
+# property_object_schema's field names, so the constant cannot be computed
+# from the schema directly; all Properties sharing a definition and field
+# set still share one tuple.
+_UNIQUE_ID_KW_CACHE = {}
+
+# Parsed KIM property instances keyed by property-id, so the
+# tempfile/kim_property_create round-trip runs once per definition
+_KIM_INSTANCE_CACHE = {}
 
 
 def energy_to_schema(prop_name, en_prop: dict):
@@ -101,7 +122,7 @@ def atomic_forces_to_schema(af_prop: dict):
     if af_prop.get("forces") is None:
         return {}
     af_dict = {
-        "atomic_forces_00": af_prop["forces"]["source-value"],
+        "atomic_forces": af_prop["forces"]["source-value"],
         "atomic_forces_unit": af_prop["forces"]["source-unit"],
     }
     return af_dict
@@ -131,6 +152,76 @@ def band_gap_to_schema(bg_prop: dict):
     return bg_dict
 
 
+def _identity(data):
+    return data
+
+
+# type(data)-keyed fast path for the per-field coercions in from_definition;
+# subclasses fall back to the isinstance ladder
+_COERCE_FAST = {
+    str: _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    np.ndarray: np.ndarray.tolist,
+    list: lambda data: np.atleast_1d(data).tolist(),
+    np.int32: int,
+    np.int64: int,
+    np.float32: float,
+    np.float64: float,
+}
+
+
+_TOKEN_RE = re.compile(r"([*/])")
+
+
+def _parse_unit_factor(units):
+    """
+    Multiplicative factor for a compound unit string split on '*' and '/',
+    with '^' exponents, as described in the Property docstring.
+    """
+    parts = _TOKEN_RE.split(units)
+    factor = 1.0
+    for op, token in zip(["*"] + parts[1::2], parts[0::2]):
+        if "^" in token:
+            token, _, power = token.partition("^")
+            un = _UNIT_FACTORS[token] ** int(power)
+        else:
+            un = _UNIT_FACTORS[token]
+        if op == "*":
+            factor *= un
+        else:
+            factor /= un
+    return factor
+
+
+@functools.lru_cache(maxsize=256)
+def _unit_factor(src_unit, dst_unit):
+    """
+    Factor converting values in ``src_unit`` to ``dst_unit``, parsed once per
+    unique pair of unit strings and cached.
+    """
+    return _parse_unit_factor(src_unit) / _parse_unit_factor(dst_unit)
+
+
+# Flattened spark-row key names keyed by (property name, inner key tuple);
+# the '-' -> '_' renames are identical for every Property of a definition
+_FLAT_KEY_CACHE = {}
+
+
+def _flat_key_items(outer_key, inner_keys):
+    cache_key = (outer_key, inner_keys)
+    items = _FLAT_KEY_CACHE.get(cache_key)
+    if items is None:
+        items = [
+            (k2, f"{outer_key}_{k2}".replace("-", "_"))
+            for k2 in inner_keys
+            if k2 not in ("property-id", "instance-id")
+        ]
+        _FLAT_KEY_CACHE[cache_key] = items
+    return items
+
+
 prop_to_row_mapper = {
     "energy": energy_to_schema,
     "atomic-forces": atomic_forces_to_schema,
@@ -139,10 +230,11 @@ prop_to_row_mapper = {
 }
 
 
-def md_from_map(pmap_md, config: AtomicConfiguration) -> tuple:
+def md_from_map(pmap_md, config: AtomicConfiguration) -> str | None:
     """
     Extract metadata from a property map.
-    Returns metadata dict as a JSON string..
+    Returns the metadata dict as a JSON string, or None if no metadata
+    fields were gathered.
     """
     if isinstance(pmap_md, list):
         pmap_md = pmap_md[0]
@@ -152,7 +244,7 @@ def md_from_map(pmap_md, config: AtomicConfiguration) -> tuple:
             v = pmap_md[md_field]["value"]
         elif "field" in pmap_md[md_field]:
             field_key = pmap_md[md_field]["field"]
-            if md_field == 'metadata' or '_metadata':
+            if md_field in _MD_KEYS:
                 if field_key in config.info:
                     assert isinstance(config.info[field_key], dict)
                     for k2,v2 in config.info[field_key].items():
@@ -174,7 +266,12 @@ def md_from_map(pmap_md, config: AtomicConfiguration) -> tuple:
             }
         else:
             gathered_fields[md_field] =  v
-    return json.dumps(gathered_fields)
+    if not gathered_fields:
+        return None
+    return orjson.dumps(
+        gathered_fields,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode()
 
 
 class PropertyParsingError(Exception):
@@ -284,23 +381,45 @@ class Property(dict):
         else:
             self.property_map = {}
         self.metadata = metadata
-        self.chemical_formula_hill = instance.pop("chemical_formula_hill")
         if standardize_energy:
             self.standardize_energy()
         if dataset_id is not None:
             self.dataset_id = dataset_id
-        self.spark_row = self.to_spark_row()
-        # TODO: Dynamically get unique_identifiers
-        self.unique_identifier_kw = []
-        for k,v in self.spark_row.items():
-            if k not in ['last_modified']:
-                self.unique_identifier_kw.append(k)
-        self._hash = _hash(self.spark_row, self.unique_identifier_kw, False)
-        self.spark_row["hash"] = str(self._hash)
-        self._id = f"PO_{self._hash}"
-        if len(self._id) > 28:
-            self._id = self._id[:28]
-        self.spark_row["id"] = self._id
+        self._row_core = self.to_spark_row()
+        key_set = tuple(self._row_core)
+        kws = _UNIQUE_ID_KW_CACHE.get(key_set)
+        if kws is None:
+            kws = tuple(sorted(k for k in key_set if k != "last_modified"))
+            _UNIQUE_ID_KW_CACHE[key_set] = kws
+        self.unique_identifier_kw = kws
+        subset = {k: self._row_core[k] for k in self.unique_identifier_kw}
+        self._hash = hashlib.blake2b(
+            orjson.dumps(
+                subset, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ),
+            digest_size=14,
+        ).hexdigest()
+        self._hash_int = int(self._hash, 16)
+        # blake2b digest_size=14 gives 28 hex chars, so this always truncates
+        self._id = f"PO_{self._hash}"[:28]
+
+    @functools.cached_property
+    def spark_row(self):
+        """
+        The full writable row, materialized on first access so Properties that
+        are only hashed or deduplicated never pay for it.
+        """
+        row = self._row_core
+        row["last_modified"] = datetime.datetime.now(
+            tz=datetime.timezone.utc
+        ).replace(microsecond=0)
+        row["hash"] = self._hash
+        row["id"] = self._id
+        # Bucketed on the join key shared with configurations
+        configuration_id = row.get("configuration_id")
+        if configuration_id is not None:
+            row["bucket_id"] = crc32(configuration_id.encode("utf-8")) % N_BUCKETS
+        return row
 
     @property
     def instance(self):
@@ -309,12 +428,9 @@ class Property(dict):
     @instance.setter
     def instance(self, edn):
         self._instance = edn
-        fields = []
-        for key in self._instance:
-            if key in _ignored_fields:
-                continue
-            fields.append(key)
-        self._property_fields = fields
+        self._property_fields = [
+            key for key in self._instance if key not in _ignored_fields
+        ]
 
     @property
     def property_fields(self):
@@ -344,8 +460,8 @@ class Property(dict):
         # global KIM_PROPERTIES
         load_from_existing = False
         if isinstance(definition, dict):
-            # TODO: this is probably slowing things down a bit
-            dummy_dict = deepcopy(definition)
+            # Only property-id is ever overridden, so a top-level copy suffices
+            dummy_dict = dict(definition)
             # Spoof if necessary
             if VALID_KIM_ID.match(dummy_dict["property-id"]) is None:
                 # Invalid ID. Try spoofing it
@@ -373,6 +489,7 @@ class Property(dict):
             else:
                 # Then this has to be an existing (or added) KIM Property Definition
                 load_from_existing = True
+                definition_name = definition
                 # It may have been added previously, but spoofed
                 if VALID_KIM_ID.match(definition) is None:
                     # Invalid ID. Try spoofing it
@@ -382,6 +499,9 @@ class Property(dict):
                 "Property definition must either be a dictionary "
                 "or a path to an EDN file"
             )
+        cached = _KIM_INSTANCE_CACHE.get(definition_name)
+        if cached is not None:
+            return cached.copy()
         if load_from_existing:
             instance = kim_edn.loads(
                 kim_property_create(
@@ -404,7 +524,9 @@ class Property(dict):
                         property_name=tmp.name,
                     )
                 )[0]
-        return instance
+        _KIM_INSTANCE_CACHE[definition_name] = instance
+        # Shallow copy is sufficient: callers only reassign top-level keys
+        return instance.copy()
 
     @classmethod
     def from_definition(
@@ -457,17 +579,19 @@ class Property(dict):
                 instance = instance.copy()
                 #print (instance)
                 not_present = 0
+                info = configuration.info
+                arrays = configuration.arrays
                 for pmap_i, pmap in enumerate(pmap_list):
                     #print (pmap.items())
-                    #print (configuration.info)
                     for key, val in pmap.items():
+                        field = val.get("field")
                         if "value" in val:
                             # Default value provided
                             data = val["value"]
-                        elif val["field"] in configuration.info:
-                            data = configuration.info[val["field"]]
-                        elif val["field"] in configuration.arrays:
-                            data = configuration.arrays[val["field"]]
+                        elif field in info:
+                            data = info[field]
+                        elif field in arrays:
+                            data = arrays[field]
                         else:
                             # TODO: Populate non existing ones with None
                             # Key not found on configurations. Will be checked later
@@ -476,20 +600,20 @@ class Property(dict):
                             missing_name = key
                             continue
 
-                        if isinstance(data, (np.ndarray, list)):
+                        coerce = _COERCE_FAST.get(type(data))
+                        if coerce is not None:
+                            data = coerce(data)
+                        elif isinstance(data, (np.ndarray, list)):
                             data = np.atleast_1d(data).tolist()
                         elif isinstance(data, np.integer):
                             data = int(data)
                         elif isinstance(data, np.floating):
                             data = float(data)
-                        elif isinstance(data, (str, bool, int, float)):
-                            pass
-                        instance[key] = {
-                            "source-value": data,
-                        }
-
-                        if (val["units"] != "None") and (val["units"] is not None):
-                            instance[key]["source-unit"] = val["units"]
+                        entry = {"source-value": data}
+                        units = val.get("units")
+                        if units is not None and units != "None":
+                            entry["source-unit"] = units
+                        instance[key] = entry
                 # TODO: Check below
                 #print ('instance', instance)
                 if not_present:
@@ -507,8 +631,7 @@ class Property(dict):
                     instance, pdef_dict[pname]
                 )
                 pdef_dict[pname]["property-name"] = prop_name_tmp
-                props_dict[pname] = {k: v for k, v in instance.items()}
-        props_dict["chemical_formula_hill"] = configuration.get_chemical_formula()
+                props_dict[pname] = instance
         props_dict["configuration_id"] = configuration.id
         return cls(
             definitions=definitions,
@@ -527,7 +650,8 @@ class Property(dict):
         # TODO: contruct empty dict from schema or just use instance instead
         row_dict = {}
         #row_dict = _empty_dict_from_schema(property_object_schema)
-        row_dict['metadata'] = self.metadata
+        if self.metadata is not None:
+            row_dict['metadata'] = self.metadata
         for key, val in self.instance.items():
             if key == "method":
                 row_dict["method"] = val
@@ -538,11 +662,8 @@ class Property(dict):
             elif key == "configuration_id":
                 row_dict["configuration_id"] = val
             else:
-                for k2, v2 in val.items():
-                    if k2 in ['property-id', 'instance-id']:
-                        continue
-                    else:
-                        row_dict[f'{key}_{k2}'.replace('-','_')] = v2['source-value']
+                for k2, flat_key in _flat_key_items(key, tuple(val)):
+                    row_dict[flat_key] = val[k2]["source-value"]
             '''
             if key == "method":
                 row_dict["method"] = val
@@ -557,12 +678,6 @@ class Property(dict):
             else:
                 row_dict.update(prop_to_row_mapper[key](val))
             '''
-        row_dict["last_modified"] = dateutil.parser.parse(
-            datetime.datetime.now(tz=datetime.timezone.utc).strftime(
-                "%Y-%m-%dT%H:%M:%SZ"
-            )
-        )
-        row_dict["chemical_formula_hill"] = self.chemical_formula_hill
         row_dict["multiplicity"] = 1
         row_dict["dataset_id"] = self.dataset_id
         return row_dict
@@ -573,20 +688,28 @@ class Property(dict):
         from its original units to the expected ColabFit-compliant units.
         """
         for prop_name, prop_dict in self.instance.items():
-            if prop_name not in MAIN_KEY_MAP.keys():
+            if prop_name not in MAIN_KEY_MAP:
                 continue
             p_info = MAIN_KEY_MAP[prop_name]
             if p_info.key not in prop_dict:
                 print(f"Property {p_info.key} not found in {prop_name}")
                 continue
             units = prop_dict[p_info.key]["source-unit"]
+            needs_ref = "reference-energy" in prop_dict
+            needs_per_atom = (
+                prop_dict.get("per-atom", {}).get("source-value") is True
+            )
+            needs_unit = units != p_info.unit
+            if not (needs_ref or needs_per_atom or needs_unit):
+                # Already standardized; skip the array round-trip entirely
+                continue
             if p_info.dtype == list:
-                prop_val = np.array(
+                prop_val = np.asarray(
                     prop_dict[p_info.key]["source-value"], dtype=np.float64
                 )
             else:
                 prop_val = prop_dict[p_info.key]["source-value"]
-            if "reference-energy" in prop_dict:
+            if needs_ref:
                 if prop_dict["reference-energy"]["source-unit"] != units:
                     raise RuntimeError(
                         "Units of the reference energy and energy must be the same"
@@ -594,42 +717,14 @@ class Property(dict):
                 else:
                     prop_val += prop_dict["reference-energy"]["source-value"]
 
-            if "per-atom" in prop_dict:
-                if prop_dict["per-atom"]["source-value"] is True:
-                    if self.nsites is None:
-                        raise RuntimeError("nsites must be provided to convert per-atom")
-                    prop_val *= self.nsites
+            if needs_per_atom:
+                if self.nsites is None:
+                    raise RuntimeError("nsites must be provided to convert per-atom")
+                prop_val *= self.nsites
 
-            if units != p_info.unit:
-                split_units = list(
-                    itertools.chain.from_iterable(
-                        [sp.split("/") for sp in units.split("*")]
-                    )
-                )
-                powers = []
-                for i, sp_un in enumerate(split_units):
-                    if "^" in sp_un:
-                        split = sp_un.split("^")
-                        powers.append(int(split[1]))
-                        split_units[i] = split[0]
-                    else:
-                        powers.append(1)
-                if powers[0] != 1:
-                    prop_val *= np.power(float(UNITS[split_units[0]]), powers[0])
-                else:
-                    prop_val *= float(UNITS[split_units[0]])
-                for u, power in zip(split_units[1:], powers[1:]):
-                    un = UNITS[u]
-                    if power != 1:
-                        un = np.power(un, power)
-                    if units[units.find(u) - 1] == "*":
-                        prop_val *= un
-                    elif units[units.find(u) - 1] == "/":
-                        prop_val /= un
-                    else:
-                        raise RuntimeError(
-                            f"There may be something wrong with the units: {u}"
-                        )
+            if needs_unit:
+                # In-place for force/stress arrays; no intermediate allocation
+                prop_val *= _unit_factor(units, p_info.unit)
             if p_info.dtype == list:
                 prop_val = prop_val.tolist()
             self.instance[prop_name][p_info.key] = {
@@ -638,11 +733,7 @@ class Property(dict):
             }
 
     def __hash__(self):
-
-        return _hash(
-            self.spark_row,
-            sorted(self.unique_identifier_kw),
-        )
+        return self._hash_int
 
     def __eq__(self, other):
         """
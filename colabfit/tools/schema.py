@@ -3,12 +3,17 @@ Each schema for VastDB has a corresponding schema for a dataframe with
 the same fields, but with non-stringified lists.
 config_schema (with stringified lists), for example, has a corresponding
 config_df_schema (with non-stringified lists).
+
+All variants are generated from the canonical field specs in _SPECS by
+make_schema, so each entity's columns are declared exactly once.
 """
 
 from pyspark.sql.types import (
     ArrayType,
     BooleanType,
+    ByteType,
     DoubleType,
+    FloatType,
     IntegerType,
     LongType,
     StringType,
@@ -17,141 +22,195 @@ from pyspark.sql.types import (
     TimestampType,
 )
 
-from colabfit.tools.utilities import get_stringified_schema
+from colabfit.tools.utilities import spark_schema_to_arrow_schema
 
 NSITES_COL_SPLITS = 20
 
-config_df_schema = StructType(
-    [
-        StructField("id", StringType(), True),
-        StructField("hash", StringType(), True),
-        StructField("last_modified", TimestampType(), True),
-        StructField("dataset_ids", ArrayType(StringType()), True),
-        StructField("configuration_set_ids", ArrayType(StringType()), True),
-        StructField("chemical_formula_hill", StringType(), True),
-        StructField("chemical_formula_reduced", StringType(), True),
-        StructField("chemical_formula_anonymous", StringType(), True),
-        StructField("elements", ArrayType(StringType()), True),
-        StructField("elements_ratios", ArrayType(DoubleType()), True),
-        StructField("atomic_numbers", ArrayType(IntegerType()), True),
-        StructField("nsites", IntegerType(), True),
-        StructField("nelements", IntegerType(), True),
-        StructField("nperiodic_dimensions", IntegerType(), True),
-        StructField("cell", ArrayType(ArrayType(DoubleType())), True),
-        StructField("dimension_types", ArrayType(IntegerType()), True),
-        StructField("pbc", ArrayType(BooleanType()), True),
-        StructField("names", ArrayType(StringType()), True),
-        StructField("labels", ArrayType(StringType()), True),
-        StructField(f"positions", ArrayType(ArrayType(DoubleType())), True),
-        #StructField("metadata_id", StringType(), True),
-        #StructField("metadata_path", StringType(), True),
-        #StructField("metadata_size", IntegerType(), True),
-    ]
-    #+ [
-    #    StructField(f"positions_{i:02d}", ArrayType(ArrayType(DoubleType())), True)
-    #    for i in range(NSITES_COL_SPLITS)
-    #]
-)
-config_schema = get_stringified_schema(config_df_schema)
-config_md_schema = config_df_schema.add(StructField("metadata", StringType(), True))
+# Number of buckets for the bucket_id partitioning column on configurations
+# and property objects. bucket_id is derived from the configuration id on
+# both sides, so a CO<->PO join over matching bucket specs avoids a shuffle
+# (df.write.bucketBy(N_BUCKETS, "bucket_id") on Parquet-backed tables).
+N_BUCKETS = 256
 
+# Advisory per-column hints carried in StructField metadata: bloom filters
+# for the synthetic keys that get equality lookups, dictionary encoding for
+# low-cardinality strings. No writer reads field metadata itself — Spark's
+# Parquet writer wants column-suffixed options like
+# parquet.bloom.filter.enabled#id — so a Parquet write site must apply
+# parquet_write_options() to make them effective. The Vast and Postgres
+# writers ignore them entirely.
+_BLOOM_HINT = {
+    "parquet.bloom.filter.enabled": "true",
+    "parquet.bloom.filter.expected.ndv": "1000000",
+}
+_DICT_HINT = {"parquet.enable.dictionary": "true"}
 
-property_object_df_schema = StructType(
-    [
-        StructField("id", StringType(), True),
-        StructField("hash", StringType(), True),
-        StructField("last_modified", TimestampType(), True),
-        StructField("configuration_id", StringType(), True),
-        StructField("dataset_id", StringType(), True),
-        StructField("multiplicity", IntegerType(), True),
-        StructField("metadata_id", StringType(), True),
-        StructField("metadata_path", StringType(), True),
-        StructField("metadata_size", IntegerType(), True),
-        StructField("software", StringType(), True),
-        StructField("method", StringType(), True),
-        StructField("chemical_formula_hill", StringType(), True),
-        StructField("energy", DoubleType(), True),
-    ]
-    + [
-        StructField(f"atomic_forces_{i:02d}", ArrayType(ArrayType(DoubleType())), True)
-        for i in range(NSITES_COL_SPLITS)
-    ]
-    + [
-        StructField("cauchy_stress", ArrayType(ArrayType(DoubleType())), True),
-        StructField("cauchy_stress_volume_normalized", BooleanType(), True),
-        StructField("electronic_band_gap", DoubleType(), True),
-        StructField("electronic_band_gap_type", StringType(), True),
-        StructField("formation_energy", DoubleType(), True),
-        StructField("adsorption_energy", DoubleType(), True),
-        StructField("atomization_energy", DoubleType(), True),
-    ]
-    # TODO: Add schema associated with new properties: selection/descriptor
-)
+# Canonical (name, dtype[, metadata]) specs for each entity. make_schema
+# derives the dataframe, stringified and metadata-bearing StructTypes
+# from these.
+_SPECS = {
+    "config": [
+        ("id", StringType(), _BLOOM_HINT),
+        ("hash", StringType(), _BLOOM_HINT),
+        ("last_modified", TimestampType()),
+        ("dataset_ids", ArrayType(StringType()), _BLOOM_HINT),
+        ("configuration_set_ids", ArrayType(StringType())),
+        ("chemical_formula_hill", StringType(), _DICT_HINT),
+        ("chemical_formula_reduced", StringType(), _DICT_HINT),
+        ("chemical_formula_anonymous", StringType(), _DICT_HINT),
+        ("elements", ArrayType(StringType()), _DICT_HINT),
+        ("elements_ratios", ArrayType(FloatType())),
+        ("atomic_numbers", ArrayType(IntegerType())),
+        ("nsites", IntegerType()),
+        ("nelements", IntegerType()),
+        ("nperiodic_dimensions", IntegerType()),
+        ("cell", ArrayType(ArrayType(DoubleType()))),
+        ("dimension_types", ArrayType(IntegerType())),
+        # pbc is always length 3; packed into bits 0/1/2 of a single byte
+        ("pbc", ByteType()),
+        ("names", ArrayType(StringType())),
+        ("labels", ArrayType(StringType())),
+        ("positions", ArrayType(ArrayType(DoubleType()))),
+        ("bucket_id", IntegerType()),
+        # ("metadata_id", StringType()),
+        # ("metadata_path", StringType()),
+        # ("metadata_size", IntegerType()),
+    ],
+    "property_object": [
+        ("id", StringType(), _BLOOM_HINT),
+        ("hash", StringType(), _BLOOM_HINT),
+        ("last_modified", TimestampType()),
+        ("configuration_id", StringType(), _BLOOM_HINT),
+        ("dataset_id", StringType(), _BLOOM_HINT),
+        ("multiplicity", IntegerType()),
+        ("metadata_id", StringType()),
+        ("metadata_path", StringType()),
+        ("metadata_size", IntegerType()),
+        ("software", StringType()),
+        ("method", StringType()),
+        ("energy", DoubleType()),
+        ("atomic_forces", ArrayType(ArrayType(DoubleType()))),
+        ("cauchy_stress", ArrayType(ArrayType(DoubleType()))),
+        ("cauchy_stress_volume_normalized", BooleanType()),
+        ("electronic_band_gap", DoubleType()),
+        ("electronic_band_gap_type", StringType()),
+        ("formation_energy", DoubleType()),
+        ("adsorption_energy", DoubleType()),
+        ("atomization_energy", DoubleType()),
+        ("bucket_id", IntegerType()),
+        # TODO: Add schema associated with new properties: selection/descriptor
+    ],
+    "dataset": [
+        ("id", StringType(), _BLOOM_HINT),
+        ("hash", StringType(), _BLOOM_HINT),
+        ("name", StringType()),
+        ("last_modified", TimestampType()),
+        ("nconfigurations", IntegerType()),
+        ("nproperty_objects", LongType()),
+        ("nsites", LongType()),
+        ("nelements", IntegerType()),
+        ("elements", ArrayType(StringType()), _DICT_HINT),
+        ("total_elements_ratios", ArrayType(FloatType())),
+        ("nperiodic_dimensions", ArrayType(IntegerType())),
+        ("dimension_types", ArrayType(ArrayType(IntegerType()))),
+        ("energy_count", LongType()),
+        # mean keeps full precision; variance is only ever used as a spread
+        # indicator, so float32 is plenty once the double accumulation is done
+        ("energy_mean", DoubleType()),
+        ("energy_variance", FloatType()),
+        ("atomization_energy_count", LongType()),
+        ("adsorption_energy_count", LongType()),
+        ("formation_energy_count", LongType()),
+        ("atomic_forces_count", LongType()),
+        ("electronic_band_gap_count", LongType()),
+        ("cauchy_stress_count", LongType()),
+        ("authors", ArrayType(StringType())),
+        ("description", StringType()),
+        ("extended_id", StringType()),
+        ("license", StringType()),
+        ("links", StringType()),
+        ("publication_year", StringType()),
+        ("doi", StringType()),
+        # ("labels", ArrayType(StringType())),
+    ],
+    "configuration_set": [
+        ("id", StringType(), _BLOOM_HINT),
+        ("hash", StringType(), _BLOOM_HINT),
+        ("last_modified", TimestampType()),
+        ("nconfigurations", IntegerType()),
+        ("nperiodic_dimensions", ArrayType(IntegerType())),
+        ("dimension_types", ArrayType(ArrayType(IntegerType()))),
+        ("nsites", LongType()),
+        ("nelements", IntegerType()),
+        ("elements", ArrayType(StringType()), _DICT_HINT),
+        ("total_elements_ratios", ArrayType(FloatType())),
+        ("description", StringType()),
+        ("name", StringType()),
+        ("dataset_id", StringType(), _BLOOM_HINT),
+        ("ordered", BooleanType()),
+        ("extended_id", StringType()),
+    ],
+}
 
-property_object_schema = get_stringified_schema(property_object_df_schema)
-property_object_md_schema = property_object_df_schema.add(
-    StructField("metadata", StringType(), True)
-)
+_SCHEMA_CACHE = {}
 
 
-dataset_df_schema = StructType(
-    [
-        StructField("id", StringType(), True),
-        StructField("hash", StringType(), True),
-        StructField("name", StringType(), True),
-        StructField("last_modified", TimestampType(), True),
-        StructField("nconfigurations", IntegerType(), True),
-        StructField("nproperty_objects", LongType(), True),
-        StructField("nsites", LongType(), True),
-        StructField("nelements", IntegerType(), True),
-        StructField("elements", ArrayType(StringType()), True),
-        StructField("total_elements_ratios", ArrayType(DoubleType()), True),
-        StructField("nperiodic_dimensions", ArrayType(IntegerType()), True),
-        StructField("dimension_types", ArrayType(ArrayType(IntegerType())), True),
-        StructField("energy_count", LongType(), True),
-        StructField("energy_mean", DoubleType(), True),
-        StructField("energy_variance", DoubleType(), True),
-        StructField("atomization_energy_count", LongType(), True),
-        StructField("adsorption_energy_count", LongType(), True),
-        StructField("formation_energy_count", LongType(), True),
-        StructField("atomic_forces_count", LongType(), True),
-        StructField("electronic_band_gap_count", LongType(), True),
-        StructField("cauchy_stress_count", LongType(), True),
-        StructField("authors", ArrayType(StringType()), True),
-        StructField("description", StringType(), True),
-        StructField("extended_id", StringType(), True),
-        StructField("license", StringType(), True),
-        StructField("links", StringType(), True),
-        StructField("publication_year", StringType(), True),
-        StructField("doi", StringType(), True),
-        # StructField("labels", ArrayType(StringType()), True),
-    ]
-)
+def make_schema(entity, stringify=False, with_metadata=False):
+    """
+    Build the StructType for ``entity`` from its canonical spec in one pass.
 
-dataset_schema = get_stringified_schema(dataset_df_schema)
+    ``stringify`` substitutes StringType for array columns (the layout the
+    Vast connector requires); ``with_metadata`` appends the metadata column.
+    Results are cached, so every caller shares one StructType per variant.
+    """
+    key = (entity, stringify, with_metadata)
+    cached = _SCHEMA_CACHE.get(key)
+    if cached is not None:
+        return cached
+    fields = []
+    for spec in _SPECS[entity]:
+        name, dtype = spec[0], spec[1]
+        hints = spec[2] if len(spec) > 2 else None
+        if stringify and dtype.typeName() == "array":
+            dtype = StringType()
+        fields.append(StructField(name, dtype, True, hints))
+    if with_metadata:
+        fields.append(StructField("metadata", StringType(), True))
+    schema = StructType(fields)
+    _SCHEMA_CACHE[key] = schema
+    return schema
 
 
-configuration_set_df_schema = StructType(
-    [
-        StructField("id", StringType(), True),
-        StructField("hash", StringType(), True),
-        StructField("last_modified", TimestampType(), True),
-        StructField("nconfigurations", IntegerType(), True),
-        StructField("nperiodic_dimensions", ArrayType(IntegerType()), True),
-        StructField("dimension_types", ArrayType(ArrayType(IntegerType())), True),
-        StructField("nsites", LongType(), True),
-        StructField("nelements", IntegerType(), True),
-        StructField("elements", ArrayType(StringType()), True),
-        StructField("total_elements_ratios", ArrayType(DoubleType()), True),
-        StructField("description", StringType(), True),
-        StructField("name", StringType(), True),
-        StructField("dataset_id", StringType(), True),
-        StructField("ordered", BooleanType(), True),
-        StructField("extended_id", StringType(), True),
-    ]
-)
+def parquet_write_options(schema):
+    """
+    Translate the per-field hints in ``schema`` into the column-suffixed
+    options Spark's Parquet writer actually reads, e.g.
+    ``parquet.bloom.filter.enabled#id``. Apply them at the write site:
+
+        writer = df.write
+        for key, value in parquet_write_options(df.schema).items():
+            writer = writer.option(key, value)
+    """
+    options = {}
+    for field in schema:
+        for key, value in (field.metadata or {}).items():
+            options[f"{key}#{field.name}"] = value
+    return options
 
-configuration_set_schema = get_stringified_schema(configuration_set_df_schema)
+
+config_df_schema = make_schema("config")
+config_schema = make_schema("config", stringify=True)
+config_md_schema = make_schema("config", with_metadata=True)
+
+property_object_df_schema = make_schema("property_object")
+property_object_schema = make_schema("property_object", stringify=True)
+property_object_md_schema = make_schema("property_object", with_metadata=True)
+
+dataset_df_schema = make_schema("dataset")
+dataset_schema = make_schema("dataset", stringify=True)
+
+configuration_set_df_schema = make_schema("configuration_set")
+configuration_set_schema = make_schema("configuration_set", stringify=True)
 
 co_cs_mapping_schema = StructType(
     [
@@ -159,3 +218,13 @@ co_cs_mapping_schema = StructType(
         StructField("configuration_set_id", StringType(), True),
     ]
 )
+
+# Arrow twins of the dataframe schemas, for ingest paths that build
+# pyarrow Tables directly (pa.Table.from_pylist + createDataFrame with
+# arrow transfer enabled) instead of constructing a Python Row per row.
+config_arrow_schema = spark_schema_to_arrow_schema(config_df_schema)
+property_object_arrow_schema = spark_schema_to_arrow_schema(property_object_df_schema)
+dataset_arrow_schema = spark_schema_to_arrow_schema(dataset_df_schema)
+configuration_set_arrow_schema = spark_schema_to_arrow_schema(
+    configuration_set_df_schema
+)
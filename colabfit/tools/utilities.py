@@ -5,12 +5,15 @@ from ast import literal_eval
 from hashlib import sha512
 
 import numpy as np
-#import pyarrow as pa
+import pyarrow as pa
 from pyspark.sql import Row
 from pyspark.sql import functions as sf
 from pyspark.sql.types import (
+    ArrayType,
     BooleanType,
+    ByteType,
     DoubleType,
+    FloatType,
     IntegerType,
     LongType,
     StringType,
@@ -74,14 +77,26 @@ def get_spark_field_type(schema, field_name):
     raise ValueError(f"Field name {field_name} not found in schema")
 
 
+# Stringified schemas keyed by the identity of the source schema, with the
+# source kept alive so ids can't be recycled. The module-level schemas in
+# schema.py never change after import, so the field walk only needs to run
+# once per schema object.
+_STRINGIFIED_SCHEMA_CACHE = {}
+
+
 def get_stringified_schema(schema):
+    cached = _STRINGIFIED_SCHEMA_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
     new_fields = []
     for field in schema:
         if field.dataType.typeName() == "array":
             new_fields.append(StructField(field.name, StringType(), field.nullable))
         else:
             new_fields.append(field)
-    return StructType(new_fields)
+    stringified = StructType(new_fields)
+    _STRINGIFIED_SCHEMA_CACHE[id(schema)] = (schema, stringified)
+    return stringified
 
 
 def spark_to_arrow_type(spark_type):
@@ -91,16 +106,22 @@ def spark_to_arrow_type(spark_type):
     """
     if isinstance(spark_type, IntegerType):
         return pa.int32()
+    elif isinstance(spark_type, ByteType):
+        return pa.int8()
     elif isinstance(spark_type, LongType):
         return pa.int64()
     elif isinstance(spark_type, DoubleType):
         return pa.float64()
+    elif isinstance(spark_type, FloatType):
+        return pa.float32()
     elif isinstance(spark_type, StringType):
         return pa.string()
     elif isinstance(spark_type, TimestampType):
         return pa.timestamp("us")
     elif isinstance(spark_type, BooleanType):
         return pa.bool_()
+    elif isinstance(spark_type, ArrayType):
+        return pa.list_(spark_to_arrow_type(spark_type.elementType))
     elif isinstance(spark_type, StructType):
         return pa.schema(
             [
@@ -125,6 +146,20 @@ def spark_schema_to_arrow_schema(spark_schema):
     return pa.schema(fields)
 
 
+def rows_to_arrow_table(rows, spark_schema):
+    """
+    Pack row dicts into a pyarrow Table laid out like ``spark_schema``.
+
+    Arrow's builders do the per-value conversion in C++, so hot ingest
+    paths can batch their row dicts straight into columnar buffers instead
+    of constructing a Python Row per configuration. Missing keys become
+    nulls, matching createDataFrame's dict handling.
+    """
+    return pa.Table.from_pylist(
+        rows, schema=spark_schema_to_arrow_schema(spark_schema)
+    )
+
+
 def arrow_record_batch_to_rdd(schema, batch):
     names = schema.fieldNames()
     arrays = [batch.column(i) for i in range(batch.num_columns)]
@@ -566,3 +601,7 @@ ELEMENT_MAP = {
     117: "Ts",
     118: "Og",
 }
+
+# Inverse lookup indexed by atomic number, so hot paths can use C-level
+# sequence indexing instead of dict probing
+ELEMENT_ARR = tuple(ELEMENT_MAP.get(i) for i in range(119))